@@ -1,20 +1,32 @@
-from typing import List, Optional, Union, Dict
+from typing import Callable, Iterator, List, NamedTuple, Optional, Union, Dict, Set, Tuple
 from pathlib import Path
+import copy
+import hashlib
 import importlib
-from dataclasses import dataclass
+import os
+import pickle
+from functools import lru_cache
+from dataclasses import dataclass, replace
 from enum import Enum
-from urllib.parse import urlparse
+from datetime import datetime
+from types import SimpleNamespace
+from unstructured.__version__ import __version__ as _unstructured_version
 from unstructured.partition.common import Element
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from itertools import groupby
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from collections import defaultdict
+from operator import attrgetter
 
 from .ocr_processor import OCRProcessor
 
 
+@lru_cache(maxsize=None)
 def import_unstructured_partition(content_type):
     """
     Dynamically imports the appropriate partition function from the unstructured library.
 
+    Results are cached, so repeated lookups for the same content type are a dict hit.
+
     Args:
         content_type (str): The type of content to process (e.g., 'pdf', 'docx')
 
@@ -36,10 +48,32 @@ class Document:
         page_content (str): The textual content of the document page
         metadata (dict): Associated metadata like filename, page number, etc.
     """
+    # Declared by hand rather than with dataclass(slots=True), which needs Python 3.10
+    __slots__ = ("page_content", "metadata")
+
     page_content: str
     metadata: dict
 
 
+class OcrElement(NamedTuple):
+    """
+    A lightweight stand-in for an unstructured Element holding OCR-extracted text.
+
+    It carries only the attributes read while filtering and combining elements, which
+    makes it far cheaper to create than a full ``Text`` element.
+
+    Attributes:
+        text (str): Extracted text
+        metadata (SimpleNamespace): Element metadata such as filename and page number
+        category (str): Element category (default: "")
+        id (str): Element id (default: "")
+    """
+    text: str
+    metadata: SimpleNamespace
+    category: str = ""
+    id: str = ""
+
+
 @dataclass
 class ProcessingConfig:
     """
@@ -47,26 +81,45 @@ class ProcessingConfig:
 
     Attributes:
         chunk_size (int): Maximum size of text chunks (default: 500)
+        chunk_overlap (int): Number of words shared by consecutive chunks (default: 0)
         hi_res_pdf (bool): Whether to use high-resolution PDF processing (default: True)
         infer_tables (bool): Whether to detect and process tables (default: False)
         custom_splitter (callable): Custom function for splitting text (default: None)
-        max_workers (int): Maximum number of concurrent processing threads (default: 4)
+        max_workers (int): Maximum number of concurrent worker processes/threads
+            (default: None, one per CPU core up to the number of sources)
         remove_headers (bool): Whether to remove header elements (default: False)
         remove_references (bool): Whether to remove reference sections (default: False)
         filter_empty_elements (bool): Whether to remove empty elements (default: True)
-        ocr_for_images (bool): Whether to perform OCR on images (default: False)
+        ocr_for_images (bool): Whether to perform OCR on images (default: False). With the
+            'tesseract' model, images are OCRed in batches through a single Tesseract instance
+            when ``tesserocr`` and ``Pillow`` are installed (``pip install indoxMiner[tesseract]``);
+            otherwise each image is a separate ``pytesseract`` call
         ocr_model (str): OCR model to use ('tesseract' or 'paddle') (default: 'tesseract')
+        cache_dir (str): Directory for caching extracted elements of local files between runs,
+            keyed by path, modification time, size, extraction settings and unstructured version
+            (default: None, disabled)
     """
     chunk_size: int = 500
+    chunk_overlap: int = 0
     hi_res_pdf: bool = True
     infer_tables: bool = False
     custom_splitter: Optional[callable] = None
-    max_workers: int = 4
+    max_workers: Optional[int] = None
     remove_headers: bool = False
     remove_references: bool = False
     filter_empty_elements: bool = True
     ocr_for_images: bool = False
     ocr_model: str = 'tesseract'
+    cache_dir: Optional[str] = None
+
+    def __post_init__(self):
+        if self.chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1 (got chunk_size={self.chunk_size})")
+        if not 0 <= self.chunk_overlap < self.chunk_size:
+            raise ValueError(
+                f"chunk_overlap must be at least 0 and smaller than chunk_size "
+                f"(got chunk_overlap={self.chunk_overlap}, chunk_size={self.chunk_size})"
+            )
 
 
 class DocumentType(Enum):
@@ -115,17 +168,279 @@ class DocumentType(Enum):
         Raises:
             ValueError: If the file type is not supported
         """
-        if file_path.lower().startswith(("http://", "https://", "www.")):
-            return cls.HTML
+        return cls.resolve(file_path)[0]
 
-        extension = Path(file_path).suffix.lower().lstrip('.')
-        if extension == "jpg":
-            extension = "jpeg"
+    @classmethod
+    def resolve(cls, file_path: str) -> Tuple["DocumentType", Optional[str]]:
+        """
+        Determines the document type of a file path or URL, along with the URL to fetch
+        for web sources.
 
-        try:
-            return cls(extension)
-        except ValueError:
+        Args:
+            file_path (str): Path or URL to the document
+
+        Returns:
+            Tuple[DocumentType, Optional[str]]: The determined document type and the
+            normalized URL (with an ``https://`` scheme added if missing), or None for
+            local files
+
+        Raises:
+            ValueError: If the file type is not supported
+        """
+        folded = file_path.casefold()
+        if folded.startswith(("http://", "https://")):
+            return cls.HTML, file_path
+        if folded.startswith("www."):
+            return cls.HTML, f"https://{file_path}"
+
+        _, dot, extension = folded.rpartition('.')
+        if not dot or '/' in extension or '\\' in extension:
+            extension = ""
+
+        doc_type = _EXTENSION_TO_TYPE.get(extension)
+        if doc_type is None:
             raise ValueError(f"Unsupported file type: {extension}")
+        return doc_type, None
+
+
+_EXTENSION_TO_TYPE: Dict[str, DocumentType] = {
+    **{doc_type.value: doc_type for doc_type in DocumentType},
+    "jpg": DocumentType.JPEG,
+    "htm": DocumentType.HTML,
+}
+
+_MIME_TYPES: Dict[DocumentType, str] = {
+    DocumentType.PDF: "application/pdf",
+    DocumentType.XLSX: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    DocumentType.XLS: "application/vnd.ms-excel",
+    DocumentType.DOCX: "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    DocumentType.DOC: "application/msword",
+    DocumentType.PPTX: "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+    DocumentType.PPT: "application/vnd.ms-powerpoint",
+    DocumentType.HTML: "text/html",
+    DocumentType.TEXT: "text/plain",
+    DocumentType.MARKDOWN: "text/markdown",
+    DocumentType.XML: "application/xml",
+    DocumentType.CSV: "text/csv",
+    DocumentType.TSV: "text/tab-separated-values",
+    DocumentType.RTF: "application/rtf",
+    DocumentType.EPUB: "application/epub+zip",
+    DocumentType.MSG: "application/vnd.ms-outlook",
+    DocumentType.EML: "message/rfc822",
+    DocumentType.PNG: "image/png",
+    DocumentType.JPEG: "image/jpeg",
+    DocumentType.TIFF: "image/tiff",
+    DocumentType.BMP: "image/bmp",
+    DocumentType.HEIC: "image/heic",
+}
+
+
+# C-level accessors for the element attributes read on every element while filtering and
+# grouping; callers fall back to getattr defaults on AttributeError
+_ELEMENT_FIELDS = attrgetter('text', 'category', 'id')
+_PAGE_NUMBER = attrgetter('metadata.page_number')
+_PARENT_ID = attrgetter('metadata.parent_id')
+
+
+def _element_fields_with_defaults(element) -> Tuple[Optional[str], str, Optional[str]]:
+    """Slow path of ``_ELEMENT_FIELDS`` for elements missing some of the attributes."""
+    return getattr(element, 'text', None), getattr(element, 'category', ''), getattr(element, 'id', None)
+
+
+# Maps line breaks, tabs and form feeds to spaces so page text is flattened in one pass
+_WHITESPACE_TABLE = str.maketrans({"\n": " ", "\r": " ", "\t": " ", "\x0b": " ", "\x0c": " "})
+
+_IMAGE_TYPES = frozenset({
+    DocumentType.BMP,
+    DocumentType.HEIC,
+    DocumentType.JPEG,
+    DocumentType.JPG,
+    DocumentType.PNG,
+    DocumentType.TIFF,
+})
+
+
+def _partition_pdf_text_layer(file_path: str) -> List[Element]:
+    """
+    Extract elements from the embedded text layer of a PDF with pdfminer.six directly.
+
+    This covers what the unstructured "fast" strategy does without importing its PDF module,
+    which pulls in the layout detection and OCR stack used only by "hi_res". Each text box
+    becomes one ``Text`` element carrying its page number. Scanned PDFs yield no text here
+    and have to go through unstructured instead.
+
+    Args:
+        file_path (str): Path to the PDF
+
+    Returns:
+        List[Element]: Extracted elements from the document
+
+    Raises:
+        ImportError: If pdfminer.six is not installed
+    """
+    from pdfminer.high_level import extract_pages
+    from pdfminer.layout import LTTextContainer
+    from unstructured.documents.elements import ElementMetadata, Text
+
+    filename = os.path.basename(file_path)
+    elements = []
+    for page_number, page_layout in enumerate(extract_pages(file_path), 1):
+        for box in page_layout:
+            if isinstance(box, LTTextContainer):
+                metadata = ElementMetadata(filename=filename, page_number=page_number)
+                elements.append(Text(text=box.get_text().strip(), metadata=metadata))
+    return elements
+
+
+def _partition_pdf(file_path: str, config: ProcessingConfig) -> List[Element]:
+    """Partition a PDF, from its text layer alone when no element classification is needed."""
+    # Header and reference removal rely on unstructured classifying elements, so only
+    # skip it for plain text extraction
+    if not (config.hi_res_pdf or config.remove_headers or config.remove_references):
+        try:
+            elements = _partition_pdf_text_layer(file_path)
+        except ImportError:
+            elements = []
+        # Scanned PDFs have no text layer; the "fast" strategy still OCRs those
+        if any(el.text.strip() for el in elements):
+            return elements
+
+    partition_pdf = import_unstructured_partition("pdf")
+    return partition_pdf(
+        filename=file_path,
+        strategy="hi_res" if config.hi_res_pdf else "fast",
+        infer_table_structure=config.infer_tables,
+    )
+
+
+def _partition_xlsx(file_path: str, config: ProcessingConfig) -> List[Element]:
+    """Partition a spreadsheet, keeping only the table elements that carry HTML."""
+    partition_xlsx = import_unstructured_partition("xlsx")
+    elements = partition_xlsx(filename=file_path)
+    return [el for el in elements if getattr(el.metadata, 'text_as_html', None) is not None]
+
+
+def _partition_html(file_path: str, config: ProcessingConfig) -> List[Element]:
+    """Partition an HTML file, or fetch and partition a web page."""
+    partition_html = import_unstructured_partition("html")
+    # Web sources arrive here already normalized by DocumentType.resolve
+    if "://" in file_path:
+        return partition_html(url=file_path)
+    return partition_html(filename=file_path)
+
+
+def _partition_image(file_path: str, config: ProcessingConfig) -> List[Element]:
+    """Partition an image with unstructured, for when OCR is disabled."""
+    partition_image = import_unstructured_partition("image")
+    return partition_image(filename=file_path)
+
+
+def _partition_email(file_path: str, config: ProcessingConfig) -> List[Element]:
+    """Partition an .eml or .msg email."""
+    partition_email = import_unstructured_partition("email")
+    return partition_email(filename=file_path)
+
+
+def _partition_docx(file_path: str, config: ProcessingConfig) -> List[Element]:
+    """Partition a Word document."""
+    partition_docx = import_unstructured_partition("docx")
+    return partition_docx(filename=file_path)
+
+
+def _partition_pptx(file_path: str, config: ProcessingConfig) -> List[Element]:
+    """Partition a PowerPoint presentation."""
+    partition_pptx = import_unstructured_partition("pptx")
+    return partition_pptx(filename=file_path)
+
+
+# Document types without an entry are partitioned by the unstructured function named after
+# their extension (e.g. ``partition_csv`` for DocumentType.CSV)
+_PARTITIONERS: Dict[DocumentType, Callable[[str, ProcessingConfig], List[Element]]] = {
+    DocumentType.PDF: _partition_pdf,
+    DocumentType.XLSX: _partition_xlsx,
+    DocumentType.XLS: _partition_xlsx,
+    DocumentType.HTML: _partition_html,
+    DocumentType.BMP: _partition_image,
+    DocumentType.HEIC: _partition_image,
+    DocumentType.JPEG: _partition_image,
+    DocumentType.JPG: _partition_image,
+    DocumentType.PNG: _partition_image,
+    DocumentType.TIFF: _partition_image,
+    DocumentType.EML: _partition_email,
+    DocumentType.MSG: _partition_email,
+    DocumentType.DOCX: _partition_docx,
+    DocumentType.DOC: _partition_docx,
+    DocumentType.PPTX: _partition_pptx,
+    DocumentType.PPT: _partition_pptx,
+}
+
+
+def _partition_document(file_path: str, doc_type: DocumentType, config: ProcessingConfig) -> List[Element]:
+    """
+    Extract elements from a document using the appropriate unstructured partition function.
+
+    Args:
+        file_path (str): Path to the document to process
+        doc_type (DocumentType): Type of the document
+        config (ProcessingConfig): Processing configuration
+
+    Returns:
+        List[Element]: Extracted elements from the document
+    """
+    try:
+        partitioner = _PARTITIONERS.get(doc_type)
+        if partitioner is None:
+            partition_func = import_unstructured_partition(doc_type.value)
+            return partition_func(filename=file_path)
+        return partitioner(file_path, config)
+
+    except Exception as e:
+        print(f"Error processing {file_path}: {e}")
+        return []
+
+
+# Settings that change which elements are extracted from a file; only these go into the cache
+# key, so tuning chunking or worker counts keeps cached partitions valid
+_PARTITION_CONFIG_FIELDS = (
+    "hi_res_pdf",
+    "infer_tables",
+    "remove_headers",
+    "remove_references",
+    "ocr_for_images",
+    "ocr_model",
+)
+
+# Bump whenever the pickled elements change shape (e.g. OcrElement fields), so entries written
+# by an older release are not loaded
+_CACHE_FORMAT_VERSION = 1
+
+
+def _partition_config_hash(config: ProcessingConfig) -> str:
+    """
+    Hash everything besides the file itself that determines its cached elements: the
+    partition settings, the unstructured version and the cache format version.
+    """
+    settings = repr(
+        (_CACHE_FORMAT_VERSION, _unstructured_version)
+        + tuple(getattr(config, field) for field in _PARTITION_CONFIG_FIELDS)
+    )
+    return hashlib.blake2b(settings.encode(), digest_size=16).hexdigest()
+
+
+# Per-process copy of the DocumentProcessor, installed by ``_init_worker`` in each worker of
+# the process pool so tasks only need to ship their own arguments
+_worker_processor = None
+
+
+def _init_worker(processor: "DocumentProcessor"):
+    """Install the DocumentProcessor copy that this worker process runs its tasks on."""
+    global _worker_processor
+    _worker_processor = processor
+
+
+def _run_in_worker(method_name: str, *args):
+    """Call a method of the worker's DocumentProcessor copy."""
+    return getattr(_worker_processor, method_name)(*args)
 
 
 class DocumentProcessor:
@@ -150,170 +465,323 @@ class DocumentProcessor:
             sources: Single source or list of sources to process
         """
         self.sources = [str(sources)] if isinstance(sources, (str, Path)) else [str(s) for s in sources]
-        self.doc_types = {source: DocumentType.from_file(source) for source in self.sources}
+        resolved = {source: DocumentType.resolve(source) for source in self.sources}
+        self.doc_types = {source: doc_type for source, (doc_type, _) in resolved.items()}
+        self._urls = {source: url for source, (_, url) in resolved.items() if url}
+        self._path_cache = {source: Path(source) for source in self.sources}
+        self._name_cache = {source: path.name for source, path in self._path_cache.items()}
+        self._filetypes = {source: self._get_filetype(source) for source in self.sources}
         self.ocr_processor = None
 
+    def __getstate__(self):
+        # Worker processes never run OCR, and the OCR model may not be picklable
+        state = self.__dict__.copy()
+        state['ocr_processor'] = None
+        return state
+
     def _init_ocr_processor(self):
         """Initialize OCR processor if OCR processing is enabled."""
         if self.config.ocr_for_images and not self.ocr_processor:
             self.ocr_processor = OCRProcessor(model=self.config.ocr_model)
 
-    def _create_element_from_ocr(self, text: str, file_path: str) -> List[Element]:
+    def _create_element_from_ocr(self, text: str, file_path: str) -> List[OcrElement]:
         """
-        Create Element objects from OCR-extracted text.
+        Create lightweight element records from OCR-extracted text.
 
         Args:
             text (str): Extracted text from OCR
             file_path (str): Path to the processed file
 
         Returns:
-            List[Element]: List containing the created Element object
-        """
-        from unstructured.documents.elements import Text
-        import datetime
-
-        metadata = {
-            'filename': Path(file_path).name,
-            'file_directory': str(Path(file_path).parent),
-            'filetype': self._get_filetype(file_path),
-            'page_number': 1,
-            'text_as_html': text,
-            'last_modified': datetime.datetime.now().isoformat(),
-        }
+            List[OcrElement]: List containing the created element
+        """
+        metadata = SimpleNamespace(
+            filename=self._name_cache[file_path],
+            file_directory=str(self._path_cache[file_path].parent),
+            filetype=self._filetypes[file_path],
+            page_number=1,
+            text_as_html=text,
+            last_modified=datetime.now().isoformat(),
+        )
+
+        return [OcrElement(text=text, metadata=metadata)]
+
+    def _uses_ocr(self, source: str) -> bool:
+        """Check whether a source is an image that should go through the OCR processor."""
+        return self.config.ocr_for_images and self.doc_types[source] in _IMAGE_TYPES
+
+    def _cache_path(self, source: str) -> Optional[Path]:
+        """
+        Get the cache file for a source's extracted elements.
+
+        Args:
+            source (str): Source file path or URL
+
+        Returns:
+            Optional[Path]: Path of the cache file, or None if caching is disabled or the
+            source is not a local file
+        """
+        if not self.config.cache_dir or source in self._urls:
+            return None
+
+        try:
+            stat = os.stat(source)
+        except OSError:
+            return None
+
+        key = f"{source}:{stat.st_mtime_ns}:{stat.st_size}:{self._config_hash}"
+        return Path(self.config.cache_dir) / f"{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}.pkl"
+
+    def _load_cached_elements(self, cache_path: Optional[Path]) -> Optional[List[Element]]:
+        """Load cached elements, returning None on a cache miss or unreadable cache file."""
+        if cache_path is None:
+            return None
+
+        try:
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Warning: Could not read cache file {cache_path}: {e}")
+            return None
+
+    def _store_cached_elements(self, cache_path: Optional[Path], elements: List[Element]):
+        """Write elements to the cache; empty results are not cached as they may stem from errors."""
+        if cache_path is None or not elements:
+            return
 
-        element = Text(text=text)
-        element.metadata = metadata
-        return [element]
+        # Write to a temporary file first so concurrent readers never see a partial pickle
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump(elements, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            print(f"Warning: Could not write cache file {cache_path}: {e}")
+        finally:
+            # Only left behind if writing or replacing failed
+            if tmp_path.exists():
+                try:
+                    tmp_path.unlink()
+                except OSError:
+                    pass
 
-    def _filter_elements(self, elements: List[Element]) -> List[Element]:
+    def _get_elements(self, source: str) -> List[Element]:
         """
-        Filter elements based on configuration settings.
+        Extract elements from a non-OCR source with its unstructured partition function,
+        reusing cached elements when available.
 
         Args:
-            elements (List[Element]): List of elements to filter
+            source (str): Source file path or URL
 
         Returns:
-            List[Element]: Filtered list of elements
+            List[Element]: Extracted elements from the document
         """
-        if not elements:
-            return elements
+        cache_path = self._cache_path(source)
+        elements = self._load_cached_elements(cache_path)
+        if elements is None:
+            elements = _partition_document(self._urls.get(source, source), self.doc_types[source], self.config)
+            self._store_cached_elements(cache_path, elements)
+        return elements
+
+    def _process_source(self, source: str) -> List[Document]:
+        """
+        Partition a non-OCR source and convert its elements to Document objects.
+
+        Args:
+            source (str): Source file path or URL
+
+        Returns:
+            List[Document]: Processed document objects
+        """
+        return self._process_elements_to_document(self._get_elements(source), source)
+
+    def _get_ocr_elements(self, file_paths: List[str]) -> Dict[str, List[OcrElement]]:
+        """
+        Extract elements from a batch of images with a single OCR processor call,
+        reusing cached elements when available.
+
+        Args:
+            file_paths (List[str]): Paths to the images to process
+
+        Returns:
+            Dict[str, List[OcrElement]]: Extracted elements keyed by image path
+        """
+        cache_paths = {file_path: self._cache_path(file_path) for file_path in file_paths}
+        elements = {}
+        pending = []
+        for file_path in file_paths:
+            cached = self._load_cached_elements(cache_paths[file_path])
+            if cached is None:
+                pending.append(file_path)
+            else:
+                elements[file_path] = cached
+
+        if pending:
+            elements.update(self._run_ocr(pending))
+            for file_path in pending:
+                self._store_cached_elements(cache_paths[file_path], elements[file_path])
 
-        filtered = elements
+        return elements
 
-        if self.config.filter_empty_elements:
-            filtered = [el for el in filtered if hasattr(el, 'text') and el.text and el.text.strip()]
+    def _process_ocr_batch(self, file_paths: List[str]) -> Dict[str, List[Document]]:
+        """
+        OCR a batch of images and convert the elements of each to Document objects.
 
-        if self.config.remove_headers:
-            filtered = [el for el in filtered if getattr(el, 'category', '') != "Header"]
+        Args:
+            file_paths (List[str]): Paths to the images to process
 
-        if self.config.remove_references:
+        Returns:
+            Dict[str, List[Document]]: Processed document objects keyed by image path
+        """
+        elements_by_source = self._get_ocr_elements(file_paths)
+        documents = {}
+        while elements_by_source:
+            source, elements = elements_by_source.popitem()
             try:
-                reference_titles = [
-                    el for el in filtered
-                    if el.text and el.text.strip().lower() == "references" and getattr(el, 'category', '') == "Title"
-                ]
-                if reference_titles:
-                    reference_id = reference_titles[0].id
-                    filtered = [el for el in filtered if getattr(el.metadata, 'parent_id', None) != reference_id]
+                documents[source] = self._process_elements_to_document(elements, source)
             except Exception as e:
-                print(f"Warning: Could not process references: {e}")
-
-        return filtered
+                print(f"Failed to process {source}: {e}")
+                documents[source] = []
+        return documents
 
-    def _get_elements(self, file_path: str) -> List[Element]:
+    def _run_ocr(self, file_paths: List[str]) -> Dict[str, List[OcrElement]]:
         """
-        Extract elements from a document using appropriate partition function.
+        Run the OCR processor over a batch of images.
 
         Args:
-            file_path (str): Path to the document to process
+            file_paths (List[str]): Paths to the images to process
 
         Returns:
-            List[Element]: Extracted elements from the document
+            Dict[str, List[OcrElement]]: Extracted elements keyed by image path
         """
         try:
-            if (file_path.lower().endswith((".png", ".jpg", ".jpeg", ".tiff", ".bmp", ".heic")) and
-                    self.config.ocr_for_images):
+            texts = self.ocr_processor.extract_texts(file_paths)
+            return {
+                file_path: self._create_element_from_ocr(text, file_path)
+                for file_path, text in zip(file_paths, texts)
+            }
+        except Exception as e:
+            print(f"Error processing OCR batch, retrying images one by one: {e}")
+
+        elements = {}
+        for file_path in file_paths:
+            try:
                 text = self.ocr_processor.extract_text(file_path)
-                return self._create_element_from_ocr(text, file_path)
-
-            elif file_path.lower().endswith(".pdf"):
-                from unstructured.partition.pdf import partition_pdf
-                return partition_pdf(
-                    filename=file_path,
-                    strategy="hi_res" if self.config.hi_res_pdf else "fast",
-                    infer_table_structure=self.config.infer_tables,
-                )
-
-            elif file_path.lower().endswith((".xlsx", ".xls")):
-                from unstructured.partition.xlsx import partition_xlsx
-                elements = partition_xlsx(filename=file_path)
-                return [el for el in elements if getattr(el.metadata, 'text_as_html', None) is not None]
-
-            elif file_path.lower().startswith(("www", "http")) or file_path.lower().endswith(".html"):
-                from unstructured.partition.html import partition_html
-                url = file_path if urlparse(file_path).scheme else f"https://{file_path}"
-                return partition_html(url=url)
-
-            elif file_path.lower().endswith((".png", ".jpg", ".jpeg", ".tiff", ".bmp", ".heic")):
-                from unstructured.partition.image import partition_image
-                return partition_image(filename=file_path)
-
-            elif file_path.lower().endswith((".eml", ".msg")):
-                from unstructured.partition.email import partition_email
-                return partition_email(filename=file_path)
-
-            elif file_path.lower().endswith((".docx", ".doc", ".pptx", ".ppt")):
-                content_type = "docx" if file_path.lower().endswith((".docx", ".doc")) else "pptx"
-                partition_func = import_unstructured_partition(content_type)
-                return partition_func(filename=file_path)
+                elements[file_path] = self._create_element_from_ocr(text, file_path)
+            except Exception as e:
+                print(f"Error processing {file_path}: {e}")
+                elements[file_path] = []
+        return elements
 
-            else:
-                doc_type = file_path.lower().split(".")[-1]
-                partition_func = import_unstructured_partition(doc_type)
-                return partition_func(filename=file_path)
+    def _combine_elements_by_page(self, elements: List[Element]) -> Iterator[str]:
+        """
+        Filter elements based on configuration settings and combine the remaining
+        elements on the same page into single page texts, in one pass over the elements.
 
-        except Exception as e:
-            print(f"Error processing {file_path}: {e}")
-            return []
+        Only the texts of the kept elements are collected, already as lists, so each page
+        is a single ``str.join``. Pages are yielded one at a time and their texts released
+        as soon as the page content is built.
+
+        Args:
+            elements (List[Element]): Elements to filter and combine
 
-    def _combine_elements_by_page(self, elements: List[Element]) -> List[Document]:
+        Yields:
+            str: Combined page contents, ordered by page number
         """
-        Combine elements on the same page into single documents.
+        filter_empty = self.config.filter_empty_elements
+        remove_headers = self.config.remove_headers
+        reference_ids = self._find_reference_ids(elements) if self.config.remove_references else None
+
+        page_texts = defaultdict(list)
+
+        for el in elements:
+            try:
+                text, category, el_id = _ELEMENT_FIELDS(el)
+            except AttributeError:
+                text, category, el_id = _element_fields_with_defaults(el)
+
+            if filter_empty and not (text and text.strip()):
+                continue
+
+            if remove_headers and category == "Header":
+                continue
+
+            if reference_ids and el_id in reference_ids:
+                continue
+
+            if not text:
+                continue
+
+            try:
+                page_number = _PAGE_NUMBER(el)
+            except AttributeError:
+                page_number = 1
+
+            page_texts[page_number].append(text)
+
+        for page_num in sorted(page_texts):
+            page_content = " ".join(page_texts.pop(page_num))
+            page_content = page_content.translate(_WHITESPACE_TABLE).strip()
+
+            if page_content:
+                yield page_content
+
+    def _find_reference_ids(self, elements: List[Element]) -> Set[str]:
+        """
+        Collect the ids of all elements nested under a "References" title.
+
+        Elements are matched through their ``parent_id`` transitively, so content nested
+        below a sub-heading of the reference section is removed as well.
 
         Args:
-            elements (List[Element]): Elements to combine
+            elements (List[Element]): Elements to search
 
         Returns:
-            List[Document]: List of combined page documents
+            Set[str]: Ids of the elements belonging to reference sections
         """
-        documents = []
+        children = defaultdict(list)
+        pending = []
 
-        def get_page_number(element):
-            return getattr(element.metadata, 'page_number', 1)
+        for el in elements:
+            try:
+                text, category, el_id = _ELEMENT_FIELDS(el)
+            except AttributeError:
+                text, category, el_id = _element_fields_with_defaults(el)
 
-        sorted_elements = sorted(elements, key=get_page_number)
+            try:
+                parent_id = _PARENT_ID(el)
+            except AttributeError:
+                parent_id = None
 
-        for page_num, page_elements in groupby(sorted_elements, key=get_page_number):
-            page_content = " ".join(el.text for el in page_elements if hasattr(el, 'text') and el.text)
-            page_content = page_content.replace("\n", " ").strip()
+            if parent_id is not None:
+                children[parent_id].append(el_id)
 
-            if page_content:
-                documents.append(page_content)
+            if category == "Title" and text and text.strip().lower() == "references":
+                pending.append(el_id)
 
-        return documents
+        reference_ids = set()
+        while pending:
+            for child_id in children.get(pending.pop(), ()):
+                if child_id not in reference_ids:
+                    reference_ids.add(child_id)
+                    pending.append(child_id)
+
+        return reference_ids
 
-    def _should_chunk_content(self, content: str, chunk_size: int) -> bool:
+    def _should_chunk_content(self, words: List[str], chunk_size: int) -> bool:
         """
         Determine if content needs to be chunked based on size.
 
         Args:
-            content (str): Content to evaluate
+            words (List[str]): Whitespace-split words of the content to evaluate
             chunk_size (int): Maximum chunk size
 
         Returns:
             bool: True if content should be chunked
         """
-        return len(content.split()) > chunk_size
+        return len(words) > chunk_size
 
     def _chunk_content(self, content: str, chunk_size: int) -> List[str]:
         """
@@ -329,25 +797,48 @@ class DocumentProcessor:
         if self.config.custom_splitter:
             return self.config.custom_splitter(text=content, max_tokens=chunk_size)
 
-        words = content.split()
-        chunks = []
-        current_chunk = []
-        current_count = 0
-
-        for word in words:
-            if current_count + len(word.split()) > chunk_size:
-                if current_chunk:
-                    chunks.append(" ".join(current_chunk))
-                current_chunk = [word]
-                current_count = len(word.split())
-            else:
-                current_chunk.append(word)
-                current_count += len(word.split())
+        return [chunk for chunk, _, _ in self._chunk_words(content.split(), chunk_size)]
+
+    def _chunk_words(self, words: List[str], chunk_size: int) -> List[Tuple[str, int, int]]:
+        """
+        Join already split words into chunks.
+
+        Args:
+            words (List[str]): Whitespace-split words of the content
+            chunk_size (int): Maximum size of each chunk
+
+        Returns:
+            List[Tuple[str, int, int]]: Each chunk with the start and end (exclusive) word
+            indices it covers
+        """
+        return [
+            (" ".join(words[start:end]), start, end)
+            for start, end in self._chunk_windows(len(words), chunk_size)
+        ]
+
+    def _chunk_windows(self, num_words: int, chunk_size: int) -> List[Tuple[int, int]]:
+        """
+        Compute the word index windows covered by each chunk.
+
+        Consecutive windows overlap by ``config.chunk_overlap`` words so that content
+        falling on a chunk boundary is kept whole in at least one chunk.
+
+        Args:
+            num_words (int): Number of words in the content
+            chunk_size (int): Maximum size of each chunk
 
-        if current_chunk:
-            chunks.append(" ".join(current_chunk))
+        Returns:
+            List[Tuple[int, int]]: (start, end) word indices of each chunk, end exclusive
+        """
+        if num_words == 0:
+            return []
 
-        return chunks
+        overlap = self.config.chunk_overlap
+        stride = chunk_size - overlap
+        return [
+            (start, min(start + chunk_size, num_words))
+            for start in range(0, max(1, num_words - overlap), stride)
+        ]
 
     def _process_elements_to_document(self, elements: List[Element], source: str) -> List[Document]:
         """
@@ -360,86 +851,159 @@ class DocumentProcessor:
         Returns:
             List[Document]: Processed document objects
         """
-        page_contents = self._combine_elements_by_page(elements)
+        base_metadata = {
+            'filename': self._name_cache[source],
+            'filetype': self._filetypes[source],
+            'source': source,
+        }
         documents = []
 
-        for idx, content in enumerate(page_contents, 1):
-            if self._should_chunk_content(content, self.config.chunk_size):
+        for idx, content in enumerate(self._combine_elements_by_page(elements), 1):
+            words = content.split()
+            if not self._should_chunk_content(words, self.config.chunk_size):
+                metadata = {**base_metadata, 'page_number': idx}
+                documents.append(Document(page_content=content, metadata=metadata))
+
+            elif self.config.custom_splitter:
                 chunks = self._chunk_content(content, self.config.chunk_size)
                 for chunk_idx, chunk in enumerate(chunks, 1):
+                    metadata = {**base_metadata, 'page_number': idx, 'chunk_number': chunk_idx}
+                    documents.append(Document(page_content=chunk, metadata=metadata))
+
+            else:
+                # Reuse the words split for the size check instead of splitting the page again
+                chunks = self._chunk_words(words, self.config.chunk_size)
+                for chunk_idx, (chunk, start, end) in enumerate(chunks, 1):
                     metadata = {
-                        'filename': Path(source).name,
-                        'filetype': self._get_filetype(source),
+                        **base_metadata,
                         'page_number': idx,
                         'chunk_number': chunk_idx,
-                        'source': source
+                        'window_start': start,
+                        'window_end': end,
                     }
                     documents.append(Document(page_content=chunk, metadata=metadata))
-            else:
-                metadata = {
-                    'filename': Path(source).name,
-                    'filetype': self._get_filetype(source),
-                    'page_number': idx,
-                    'source': source
-                }
-                documents.append(Document(page_content=content, metadata=metadata))
 
         return documents
 
     def _get_filetype(self, source: str) -> str:
         """Get MIME type for the file."""
-        doc_type = self.doc_types[source]
-        mime_types = {
-            DocumentType.PDF: "application/pdf",
-            DocumentType.XLSX: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            DocumentType.XLS: "application/vnd.ms-excel",
-            DocumentType.DOCX: "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            DocumentType.DOC: "application/msword",
-            DocumentType.PPTX: "application/vnd.openxmlformats-officedocument.presentationml.presentation",
-            DocumentType.PPT: "application/vnd.ms-powerpoint",
-            DocumentType.HTML: "text/html",
-            DocumentType.TEXT: "text/plain",
-            DocumentType.MARKDOWN: "text/markdown",
-            DocumentType.XML: "application/xml",
-            DocumentType.CSV: "text/csv",
-            DocumentType.TSV: "text/tab-separated-values",
-            DocumentType.RTF: "application/rtf",
-            DocumentType.EPUB: "application/epub+zip",
-            DocumentType.MSG: "application/vnd.ms-outlook",
-            DocumentType.EML: "message/rfc822",
-            DocumentType.PNG: "image/png",
-            DocumentType.JPEG: "image/jpeg",
-            DocumentType.TIFF: "image/tiff",
-            DocumentType.BMP: "image/bmp",
-            DocumentType.HEIC: "image/heic",
-        }
-        return mime_types.get(doc_type, "application/octet-stream")
+        return _MIME_TYPES.get(self.doc_types[source], "application/octet-stream")
 
     def process(self, config: Optional[ProcessingConfig] = None) -> Dict[str, List[Document]]:
-        """Process all documents with the given configuration."""
+        """
+        Process all documents with the given configuration.
+
+        With more than one source to partition, documents are partitioned, filtered and chunked
+        in separate worker processes. Scripts calling this on spawn-based platforms (Windows,
+        macOS) need an ``if __name__ == "__main__":`` guard for that; if the workers fail, the
+        remaining sources are processed in threads of the current process instead. Images
+        handled by OCR are processed in batches on threads of the current process, which owns
+        the OCR model.
+        """
         self.config = config or ProcessingConfig()
 
         # Initialize OCR processor if needed
         self._init_ocr_processor()
 
-        results = {}
+        self._config_hash = _partition_config_hash(self.config)
+        if self.config.cache_dir:
+            os.makedirs(self.config.cache_dir, exist_ok=True)
+
+        max_workers = self.config.max_workers or min(os.cpu_count() or 1, max(1, len(self.sources)))
+        ocr_sources = [source for source in self.sources if self._uses_ocr(source)]
+        partition_sources = [source for source in self.sources if not self._uses_ocr(source)]
+
+        # Images are OCRed in a few large batches so the OCR model is set up once per batch
+        # rather than once per image
+        ocr_batches = [ocr_sources[i::max_workers] for i in range(min(max_workers, len(ocr_sources)))]
+
+        use_processes = len(partition_sources) > 1
+        # Parallelism comes from running OCR batches and worker processes side by side, so keep
+        # Tesseract and other OpenMP-backed libraries from also spawning threads in each of
+        # them; this has to be set before the workers import those libraries
+        if ocr_batches or use_processes:
+            os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+        # Worker processes receive a copy of this processor without the custom splitter: a
+        # user function (e.g. defined in __main__ or a notebook) may pickle here yet not be
+        # importable in a spawned worker. With a custom splitter, workers therefore only
+        # partition, and documents are built here as the elements come back
+        build_in_workers = not use_processes or self.config.custom_splitter is None
+
+        if use_processes:
+            worker_processor = copy.copy(self)
+            worker_processor.config = replace(self.config, custom_splitter=None)
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers, initializer=_init_worker, initargs=(worker_processor,)
+            )
+        else:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
 
-        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
-            future_to_source = {
-                executor.submit(self._get_elements, source): source
-                for source in self.sources
-            }
+        results = {}
+        # future -> (source, method name, args), so a task lost to a broken process pool can be
+        # rerun locally
+        future_to_task = {}
+        failed_tasks = []
+
+        def submit(source, method_name, *args):
+            task = (source, method_name, args)
+            if not use_processes:
+                future_to_task[executor.submit(getattr(self, method_name), *args)] = task
+                return
+            try:
+                future_to_task[executor.submit(_run_in_worker, method_name, *args)] = task
+            except BrokenProcessPool:
+                failed_tasks.append(task)
 
-            for future in as_completed(future_to_source):
-                source = future_to_source[future]
-                try:
-                    elements = future.result()
-                    filtered_elements = self._filter_elements(elements)
-                    results[Path(source).name] = self._process_elements_to_document(
-                        filtered_elements, source
-                    )
-                except Exception as e:
-                    print(f"Failed to process {source}: {e}")
-                    results[Path(source).name] = []
+        def collect(source, method_name, future):
+            try:
+                output = future.result()
+                if method_name == "_get_elements":
+                    output = self._process_elements_to_document(output, source)
+                results[self._name_cache[source]] = output
+            except Exception as e:
+                print(f"Failed to process {source}: {e}")
+                results[self._name_cache[source]] = []
+
+        with executor, ThreadPoolExecutor(max_workers=max_workers) as ocr_executor:
+            # Every task for the worker processes is submitted before the first OCR thread
+            # starts, so the pool never forks this process while OCR threads are running
+            stage = "_process_source" if build_in_workers else "_get_elements"
+            for source in partition_sources:
+                submit(source, stage, source)
+
+            ocr_futures = [ocr_executor.submit(self._process_ocr_batch, batch) for batch in ocr_batches]
+            for future in as_completed(ocr_futures):
+                for source, documents in future.result().items():
+                    results[self._name_cache[source]] = documents
+            del ocr_futures
+
+            # Futures are dropped as soon as they are handled so each source's data can be
+            # freed right away, instead of living until every source is done
+            for future in as_completed(list(future_to_task)):
+                source, method_name, args = future_to_task.pop(future)
+                if isinstance(future.exception(), BrokenProcessPool):
+                    failed_tasks.append((source, method_name, args))
+                    continue
+                collect(source, method_name, future)
+
+        # A worker process died or could not start, most often because the calling script lacks
+        # an ``if __name__ == "__main__":`` guard on a spawn-based platform. Rather than losing
+        # those sources, rerun them on threads of this process
+        if failed_tasks:
+            print(
+                f"Warning: worker processes failed, processing {len(failed_tasks)} remaining "
+                f"source(s) in threads instead. On Windows and macOS, call process() under an "
+                f"'if __name__ == \"__main__\":' guard to use worker processes."
+            )
+            with ThreadPoolExecutor(max_workers=max_workers) as fallback_executor:
+                future_to_task = {
+                    fallback_executor.submit(getattr(self, method_name), *args): (source, method_name)
+                    for source, method_name, args in failed_tasks
+                }
+                del failed_tasks
+                for future in as_completed(list(future_to_task)):
+                    source, method_name = future_to_task.pop(future)
+                    collect(source, method_name, future)
 
         return results
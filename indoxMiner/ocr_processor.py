@@ -1,5 +1,6 @@
 import cv2
 import pandas as pd
+from typing import List
 
 class OCRProcessor:
     def __init__(self, model: str = 'tesseract'):
@@ -38,6 +39,21 @@ class OCRProcessor:
         except ImportError:
             raise ImportError("Please install pytesseract package to use Tesseract OCR")
 
+    def extract_texts_with_tesseract(self, image_paths: List[str]) -> List[str]:
+        try:
+            from PIL import Image
+            from tesserocr import PyTessBaseAPI, PSM, OEM
+        except ImportError:
+            return [self.extract_text_with_tesseract(image_path) for image_path in image_paths]
+
+        # Keep a single Tesseract instance open so the model is only loaded once per batch
+        texts = []
+        with PyTessBaseAPI(psm=PSM.SINGLE_BLOCK, oem=OEM.DEFAULT) as api:
+            for image_path in image_paths:
+                api.SetImage(Image.fromarray(self.preprocess_image_for_tesseract(image_path)))
+                texts.append(api.GetUTF8Text().strip())
+        return texts
+
     def preprocess_image_for_easyocr(self, image_path: str):
         image = cv2.imread(image_path)
         image = cv2.resize(image, None, fx=2, fy=2, interpolation=cv2.INTER_CUBIC)
@@ -67,4 +83,9 @@ class OCRProcessor:
         elif self.model == 'easyocr':
             return self.extract_text_with_easyocr(image_path)
         else:
-            raise ValueError("Invalid OCR model selected. Choose 'tesseract', 'paddle', or 'easyocr'.")
\ No newline at end of file
+            raise ValueError("Invalid OCR model selected. Choose 'tesseract', 'paddle', or 'easyocr'.")
+
+    def extract_texts(self, image_paths: List[str]) -> list:
+        if self.model == 'tesseract':
+            return self.extract_texts_with_tesseract(image_paths)
+        return [self.extract_text(image_path) for image_path in image_paths]
@@ -33,6 +33,11 @@ setup(
                 "natural-language-processing",
     ],
     install_requires=packages,
+    extras_require={
+        # Batched Tesseract OCR keeps one tesserocr instance open per batch of images;
+        # without tesserocr/Pillow, images are OCRed one pytesseract call at a time
+        'tesseract': ['pytesseract', 'tesserocr', 'Pillow'],
+    },
     classifiers=[
         'Development Status :: 3 - Alpha',
         'Intended Audience :: Developers',